@@ -1,4 +1,3 @@
-import os
 import json
 import logging
 import base64
@@ -73,6 +72,18 @@ query downloadSbom($envId: Uuid!, $sbomId: Uuid!, $includeVulns: Boolean) {
 }
 """
 
+PRECONFIGURED_ENVS = frozenset(('default', 'development', 'production'))
+
+SBOM_ACTION_KEYS = ('checksStatus', 'policyStatus',
+                    'labelingStatus', 'automationStatus')
+
+# vulnRunStatus -> (status of the other SBOM actions, vulnScanStatus)
+VULN_RUN_STATUS = {
+    'NOT_STARTED': ('NOT_STARTED', 'NOT_STARTED'),
+    'IN_PROGRESS': ('COMPLETED', 'IN_PROGRESS'),
+    'FINISHED': ('COMPLETED', 'COMPLETED'),
+}
+
 
 class LynkContext:
     def __init__(self, api_url, token, prod_id, prod, env_id, env, ver_id, ver, output_file):
@@ -92,6 +103,9 @@ class LynkContext:
             print("Security token not found")
             return False
 
+        # Every API call authenticates the same way; build the header once
+        self.headers = {"Authorization": "Bearer " + self.token}
+
         self.data = self._fetch_context()
         if not self.data or self.data.get('errors'):
             print("Error getting Interlynk data")
@@ -99,6 +113,11 @@ class LynkContext:
                 "Possible problems: invalid security token, stale pylynk or invalid INTERLYNK_API_URL")
             return False
 
+        # The product tree is fixed for the life of the context; walk down
+        # to it once instead of on every lookup.
+        self.prod_nodes = self.data.get('data', {}).get('organization', {}).get(
+            'productNodes', {}).get('products', [])
+
         if (self.prod or self.prod_id) and not self.resolve_prod():
             self.prod = self.prod_id = None
             print('Product not found')
@@ -117,10 +136,9 @@ class LynkContext:
         return True
 
     def _fetch_context(self):
-        headers = {"Authorization": "Bearer " + self.token}
         try:
             response = requests.post(self.api_url,
-                                     headers=headers,
+                                     headers=self.headers,
                                      data=QUERY_PROJECT_PARAMS,
                                      timeout=INTERLYNK_API_TIMEOUT)
             if response.status_code == 200:
@@ -136,58 +154,46 @@ class LynkContext:
 
     def resolve_prod(self):
         if not self.prod_id:
-            nodes = self.data.get('data', {}).get('organization', {}).get(
-                'productNodes', {}).get('products', [])
             self.prod_id = next(
-                (node['id'] for node in nodes if node['name'] == self.prod), None)
+                (node['id'] for node in self.prod_nodes if node['name'] == self.prod), None)
         if not self.prod:
-            nodes = self.data.get('data', {}).get('organization', {}).get(
-                'productNodes', {}).get('products', [])
             self.prod = next(
-                (node['name'] for node in nodes if node['id'] == self.prod_id), None)
+                (node['name'] for node in self.prod_nodes if node['id'] == self.prod_id), None)
         return self.prod and self.prod_id
 
     def resolve_env(self):
         env = self.env or 'default'
         # For pre-configured environments, use case-insensitive comparison
-        if env.lower() in ['default', 'development', 'production']:
-            env = env.lower()
+        env_lower = env.lower()
+        if env_lower in PRECONFIGURED_ENVS:
+            env = env_lower
 
+        product = next((node for node in self.prod_nodes
+                        if node['id'] == self.prod_id), {})
+        env_nodes = product.get('environments', [])
         if not self.env_id:
-            for product in self.data.get('data', {}).get('organization', {}).get('productNodes', {}).get('products', []):
-                if product['id'] == self.prod_id:
-                    self.env_id = next((env_node['id'] for env_node in product.get('environments', [])
-                                        if env_node.get('name') == env), None)
+            self.env_id = next((env_node['id'] for env_node in env_nodes
+                                if env_node.get('name') == env), None)
         if not self.env:
-            for product in self.data.get('data', {}).get('organization', {}).get('productNodes', {}).get('products', []):
-                if product['id'] == self.prod_id:
-                    self.env = next((env_node['id'] for env_node in product.get('environments', [])
-                                     if env_node.get('id') == self.env_id), None)
+            self.env = next((env_node['id'] for env_node in env_nodes
+                             if env_node.get('id') == self.env_id), None)
         return self.env and self.env_id
 
     def resolve_ver(self):
-        env = self.env or 'default'
+        versions = self.versions() or []
         if not self.ver_id:
-            for product in self.data.get('data', {}).get('organization', {}).get('productNodes', {}).get('products', []):
-                if product['id'] == self.prod_id:
-                    for env in product['environments']:
-                        if env['id'] == self.env_id:
-                            for ver in env['versions']:
-                                if ver['primaryComponent']['version'] == self.ver:
-                                    self.ver_id = ver['id']
-                                    self.ver_status = self.vuln_status_to_status(ver['vulnRunStatus'])
+            for ver in versions:
+                if ver['primaryComponent']['version'] == self.ver:
+                    self.ver_id = ver['id']
+                    self.ver_status = self.vuln_status_to_status(ver['vulnRunStatus'])
         empty_ver = False
         if not self.ver:
-            for product in self.data.get('data', {}).get('organization', {}).get('productNodes', {}).get('products', []):
-                if product['id'] == self.prod_id:
-                    for env in product['environments']:
-                        if env['id'] == self.env_id:
-                            for ver in env['versions']:
-                                if ver['id'] == self.ver_id:
-                                    self.ver = ver['primaryComponent']['version']
-                                    if not self.ver:
-                                        empty_ver = True
-                                    self.ver_status = self.vuln_status_to_status(ver['vulnRunStatus'])
+            for ver in versions:
+                if ver['id'] == self.ver_id:
+                    self.ver = ver['primaryComponent']['version']
+                    if not self.ver:
+                        empty_ver = True
+                    self.ver_status = self.vuln_status_to_status(ver['vulnRunStatus'])
 
         return (empty_ver or self.ver) and self.ver_id
 
@@ -204,9 +210,8 @@ class LynkContext:
             logging.error("No products found")
             return None
 
-        prod_nodes = self.data['data']['organization']['productNodes']['products']
         prod_list = []
-        for prod in prod_nodes:
+        for prod in self.prod_nodes:
             versions = sum(len(env['versions'])
                            for env in prod['environments'])
             prod_list.append({
@@ -218,13 +223,12 @@ class LynkContext:
         return prod_list
 
     def versions(self):
-        prod_nodes = self.data['data']['organization']['productNodes']['products']
-        versions_node = next((env['versions'] for prod in prod_nodes if self.prod_id == prod['id']
+        versions_node = next((env['versions'] for prod in self.prod_nodes if self.prod_id == prod['id']
                               for env in prod['environments'] if self.env_id == env['id']), None)
         return versions_node
 
     def status(self):
-        self.resolve_ver()
+        # validate() already resolved the version and recorded its status
         return self.ver_status
 
     def download(self):
@@ -243,8 +247,7 @@ class LynkContext:
         }
 
         response = requests.post(self.api_url,
-                                 headers={
-                                     "Authorization": "Bearer " + self.token},
+                                 headers=self.headers,
                                  json=request_data,
                                  timeout=INTERLYNK_API_TIMEOUT)
 
@@ -273,10 +276,6 @@ class LynkContext:
                           response.status_code)
 
     def upload(self, sbom_file):
-        if os.path.isfile(sbom_file) is False:
-            print(f"SBOM File not found: {sbom_file}")
-            return
-
         if not self.prod_id:
             print(f"Product not found: {self.prod}")
             return
@@ -287,10 +286,6 @@ class LynkContext:
 
         logging.debug("Uploading SBOM to product ID %s", self.prod_id)
 
-        headers = {
-            "Authorization": "Bearer " + self.token
-        }
-
         operations = json.dumps({
             "query": QUERY_SBOM_UPLOAD,
             "variables": {"doc": None, "projectId": self.env_id}
@@ -302,11 +297,19 @@ class LynkContext:
             "map": map_data
         }
 
+        # Open directly rather than stat-ing first; a missing or unreadable
+        # path surfaces as OSError either way.
+        try:
+            sbom = open(sbom_file, 'rb')
+        except OSError:
+            print(f"SBOM File not found: {sbom_file}")
+            return
+
         try:
-            with open(sbom_file, 'rb') as sbom:
+            with sbom:
                 files_map = {'0': sbom}
                 response = requests.post(self.api_url,
-                                         headers=headers,
+                                         headers=self.headers,
                                          data=form_data,
                                          files=files_map,
                                          timeout=INTERLYNK_API_TIMEOUT)
@@ -318,39 +321,16 @@ class LynkContext:
                         print(f"Error uploading sbom: {errors}")
                         return 1
                     print('Uploaded successfully')
-                    logging.debug("SBOM Uploading response: %s", response.text)
+                    logging.debug("SBOM Uploading response: %s", resp_json)
                     return 0
                 logging.error("Error uploading sbom: %d", response.status_code)
         except requests.exceptions.RequestException as ex:
             logging.error("RequestException: %s", ex)
-        except FileNotFoundError as ex:
-            logging.error("FileNotFoundError: %s", ex)
         return 1
 
     def vuln_status_to_status(self, status):
-        result_dict = dict()
-        result_dict['checksStatus'] = 'UNKNOWN'
-        result_dict['policyStatus'] = 'UNKNOWN'
-        result_dict['labelingStatus'] = 'UNKNOWN'
-        result_dict['automationStatus'] = 'UNKNOWN'
-        result_dict['vulnScanStatus'] = 'UNKNOWN'
-        if status == 'NOT_STARTED':
-            result_dict['vulnScanStatus'] = 'NOT_STARTED'
-            result_dict['checksStatus'] = 'NOT_STARTED'
-            result_dict['policyStatus'] = 'NOT_STARTED'
-            result_dict['labelingStatus'] = 'NOT_STARTED'
-            result_dict['automationStatus'] = 'NOT_STARTED'
-        elif status == 'IN_PROGRESS':
-            result_dict['vulnScanStatus'] = 'IN_PROGRESS'
-            result_dict['checksStatus'] = 'COMPLETED'
-            result_dict['policyStatus'] = 'COMPLETED'
-            result_dict['labelingStatus'] = 'COMPLETED'
-            result_dict['automationStatus'] = 'COMPLETED'
-        elif status == 'FINISHED':
-            result_dict['vulnScanStatus'] = 'COMPLETED'
-            result_dict['checksStatus'] = 'COMPLETED'
-            result_dict['policyStatus'] = 'COMPLETED'
-            result_dict['labelingStatus'] = 'COMPLETED'
-            result_dict['automationStatus'] = 'COMPLETED'
+        actions_status, vuln_scan_status = VULN_RUN_STATUS.get(
+            status, ('UNKNOWN', 'UNKNOWN'))
+        result_dict = dict.fromkeys(SBOM_ACTION_KEYS, actions_status)
+        result_dict['vulnScanStatus'] = vuln_scan_status
         return result_dict
-
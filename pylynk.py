@@ -18,8 +18,6 @@ import json
 import argparse
 import logging
 import datetime
-import pytz
-import tzlocal
 from lynkctx import LynkContext
 
 
@@ -33,9 +31,12 @@ def user_time(utc_time):
     Returns:
         str: The local time formatted as a string.
     """
-    timestamp = datetime.datetime.fromisoformat(utc_time[:-1])
-    local_timezone = tzlocal.get_localzone()
-    local_time = timestamp.replace(tzinfo=pytz.UTC).astimezone(local_timezone)
+    # fromisoformat accepts the trailing 'Z' natively from Python 3.11
+    if sys.version_info < (3, 11) and utc_time.endswith('Z'):
+        utc_time = utc_time[:-1]
+    timestamp = datetime.datetime.fromisoformat(utc_time)
+    # astimezone() with no argument converts to the system local zone
+    local_time = timestamp.replace(tzinfo=datetime.timezone.utc).astimezone()
     return local_time.strftime('%Y-%m-%d %H:%M:%S %Z')
 
 
@@ -52,12 +53,14 @@ def print_products(lynk_ctx, fmt_json):
         return 0
 
 
+    # Render each timestamp once for both sizing and printing
+    updated_at = [user_time(prod['updatedAt']) for prod in products]
+
     # Calculate dynamic column widths
     name_width = max(len("NAME"), max(len(prod['name'])
                                       for prod in products))
     updated_at_width = max(len("UPDATED AT"),
-                           max(len(user_time(prod['updatedAt']))
-                               for prod in products))
+                           max(len(local_time) for local_time in updated_at))
     id_width = max(len("ID"), max(len(prod['id']) for prod in products))
     version_width = len("VERSIONS")
 
@@ -75,12 +78,12 @@ def print_products(lynk_ctx, fmt_json):
     line = "-" * width + "|"
     print(line)
 
-    for prod in products:
+    for prod, local_time in zip(products, updated_at):
         row = (
             f"{prod['name']:<{name_width}} | "
             f"{prod['id']:<{id_width}} | "
             f"{prod['versions']:<{version_width}} | "
-            f"{user_time(prod['updatedAt']):<{updated_at_width}} | "
+            f"{local_time:<{updated_at_width}} | "
         )
         print(row)
     return 0
@@ -102,20 +105,25 @@ def print_versions(lynk_ctx, fmt_json):
         print(json.dumps(versions, indent=4))
         return 0
 
+    # Collect only the versions that can be displayed; versions without
+    # a primary component are skipped when printing
+    rows = []
+    for sbom in versions:
+        primary_component = sbom.get('primaryComponent')
+        if primary_component is None:
+            continue
+        rows.append((sbom['id'],
+                     primary_component.get('version') or '',
+                     primary_component.get('name') or '',
+                     user_time(sbom['updatedAt'])))
+
     # Calculate dynamic column widths
-    id_width = max(len('ID'), max(len(sbom['id'])
-                                  for sbom in versions))
-    version_width = max(len('VERSION'),
-                        max(len(s.get('primaryComponent', {})
-                                .get('version', ''))
-                        for s in versions))
-    primary_component_width = max(len('PRIMARY COMPONENT'),
-                                  max(len(sbom.get('primaryComponent', {})
-                                          .get('name', ''))
-                                      for sbom in versions))
-    updated_at_width = max(len('UPDATED AT'),
-                           max(len(user_time(sbom['updatedAt']))
-                               for sbom in versions))
+    id_width = max([len('ID')] + [len(row[0]) for row in rows])
+    version_width = max([len('VERSION')] + [len(row[1]) for row in rows])
+    primary_component_width = max([len('PRIMARY COMPONENT')] +
+                                  [len(row[2]) for row in rows])
+    updated_at_width = max([len('UPDATED AT')] +
+                           [len(row[3]) for row in rows])
 
     # Format the header with dynamic column widths
     header = (
@@ -135,16 +143,12 @@ def print_versions(lynk_ctx, fmt_json):
     print(line)
 
     # Format each row with dynamic column widths and a bar between elements
-    for sbom in versions:
-        if sbom.get('primaryComponent') is None:
-            continue
-        version = sbom.get('primaryComponent', {}).get('version', '')
-        primary_component = sbom.get('primaryComponent', {}).get('name', '')
+    for sbom_id, version, primary_component, updated_at in rows:
         row = (
-            f"{sbom['id']:<{id_width}} | "
+            f"{sbom_id:<{id_width}} | "
             f"{version:<{version_width}} | "
             f"{primary_component:<{primary_component_width}} | "
-            f"{user_time(sbom['updatedAt']):<{updated_at_width}} |"
+            f"{updated_at:<{updated_at_width}} |"
         )
         print(row)
 
@@ -200,13 +204,16 @@ def download_sbom(lynk_ctx):
         print('Failed to fetch SBOM')
         return 1
 
-    sbom_data = json.loads(sbom.encode('utf-8'))
+    sbom_data = json.loads(sbom)
 
+    # Serialize once and hand the whole document to a single write;
+    # json.dump issues one write per encoder chunk.
+    sbom_json = json.dumps(sbom_data, indent=4, ensure_ascii=False)
     if lynk_ctx.output_file:
         with open(lynk_ctx.output_file, 'w', encoding='utf-8') as f:
-            json.dump(sbom_data, f, indent=4, ensure_ascii=False)
+            f.write(sbom_json)
     else:
-        json.dump(sbom_data, sys.stdout, indent=4, ensure_ascii=False)
+        sys.stdout.write(sbom_json)
 
     return 0
 
@@ -238,6 +245,11 @@ def setup_args():
     """
     parser = argparse.ArgumentParser(description='Interlynk command line tool')
     parser.add_argument('--verbose', '-v', action='count', default=0)
+    # Subcommands only declare the options they use; default the rest here
+    # so every attribute read later exists on the parsed namespace.
+    parser.set_defaults(token=None, prod=None, prodId=None, envId=None,
+                        env=None, verId=None, ver=None, output=None,
+                        table=False)
 
     subparsers = parser.add_subparsers(title="subcommands", dest="subcommand")
     products_parser = subparsers.add_parser("prods", help="List products")
@@ -319,9 +331,8 @@ def setup_log_level(args):
     Returns:
         None.
     """
-    if args.verbose == 0:
-        logging.basicConfig(level=logging.ERROR)
-    logging.basicConfig(level=logging.DEBUG)
+    level = logging.DEBUG if args.verbose else logging.ERROR
+    logging.basicConfig(level=level)
 
 
 def setup_lynk_context(args):
@@ -334,17 +345,17 @@ def setup_lynk_context(args):
     Returns:
         LynkContext: The LynkContext object.
     """
+    env = os.environ
     return LynkContext(
-        os.environ.get('INTERLYNK_API_URL'),
-        getattr(args, 'token', None) or os.environ.get(
-            'INTERLYNK_SECURITY_TOKEN'),
-        getattr(args, 'prodId', None),
-        getattr(args, 'prod', None),
-        getattr(args, 'envId', None),
-        getattr(args, 'env', None),
-        getattr(args, 'verId', None),
-        getattr(args, 'ver', None),
-        getattr(args, 'output', None)
+        env.get('INTERLYNK_API_URL'),
+        args.token or env.get('INTERLYNK_SECURITY_TOKEN'),
+        args.prodId,
+        args.prod,
+        args.envId,
+        args.env,
+        args.verId,
+        args.ver,
+        args.output
     )
 
 
@@ -356,26 +367,26 @@ def main() -> int:
         int: The exit code of the program.
     """
     args = setup_args()
+    # Bail out before fetching the product tree when there is nothing to run
+    if not args.subcommand:
+        print("Missing or invalid command. "
+              "Supported commands: {prods, vers, status, upload, download}")
+        exit(1)
+
     setup_log_level(args)
     lynk_ctx = setup_lynk_context(args)
     if not lynk_ctx.validate():
         exit(1)
 
     fmt_json = not args.table
-    if args.subcommand == "prods":
-        print_products(lynk_ctx, fmt_json)
-    elif args.subcommand == "vers":
-        print_versions(lynk_ctx, fmt_json)
-    elif args.subcommand == "status":
-        print_status(lynk_ctx, fmt_json)
-    elif args.subcommand == "upload":
-        upload_sbom(lynk_ctx, args.sbom)
-    elif args.subcommand == "download":
-        download_sbom(lynk_ctx)
-    else:
-        print("Missing or invalid command. \
-            Supported commands: {prods, upload, download, sign, verify}")
-        exit(1)
+    commands = {
+        "prods": lambda: print_products(lynk_ctx, fmt_json),
+        "vers": lambda: print_versions(lynk_ctx, fmt_json),
+        "status": lambda: print_status(lynk_ctx, fmt_json),
+        "upload": lambda: upload_sbom(lynk_ctx, args.sbom),
+        "download": lambda: download_sbom(lynk_ctx),
+    }
+    commands[args.subcommand]()
     exit(0)
 
 